@@ -1,58 +1,183 @@
 import datetime
+import functools
 import io
-import traceback
-from typing import List, Optional
+import logging
+import os
+import shutil
+import tempfile
+from types import MappingProxyType
+from typing import List, Optional, Union
+from urllib.parse import quote
 
 from chat_exporter.construct.transcript import Transcript
 from chat_exporter.ext.discord_import import discord
 from chat_exporter.construct.attachment_handler import AttachmentHandler, AttachmentToLocalFileHostHandler, AttachmentToDiscordChannelHandler
 
 
+_log = logging.getLogger(__name__)
+
+# Transcripts larger than this are spooled to disk rather than held in memory
+_SPOOL_THRESHOLD = 8 << 20
+
+_VIEWER_URL_FMT = "https://mahto.id/chat-exporter?url={}"
+_LINK_DESC_FMT = "[Click here to view the transcript](" + _VIEWER_URL_FMT + ")"
+
+_TRANSCRIPT_DIR = "/var/www/html/transcripts"
+
+# Only this many recent messages are scanned when removing previously posted transcripts
+_CLEANUP_LIMIT = 200
+
+_TRANSCRIPT_DEFAULTS = MappingProxyType({
+    "limit": None,
+    "messages": None,
+    "pytz_timezone": "UTC",
+    "military_time": True,
+    "fancy_times": True,
+    "before": None,
+    "after": None,
+    "support_dev": True,
+    "bot": None,
+    "attachment_handler": None,
+})
+
+_Embed = discord.Embed
+_File = discord.File
+
+_BLURPLE = discord.Colour.blurple()
+_RED = discord.Colour.red()
+
+_ERROR_EMBED = _Embed(
+    title="Transcript Generation Failed!",
+    description="Whoops! We've stumbled in to an issue here.",
+    colour=_RED
+)
+
+_LINK_EMBED_TEMPLATE = _Embed(title="Transcript Link", colour=_BLURPLE)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_transcript_dir():
+    os.makedirs(_TRANSCRIPT_DIR, exist_ok=True)
+
+
+def _build_transcript(channel: discord.TextChannel, guild: Optional[discord.Guild], **kwargs) -> Transcript:
+    return Transcript(**{**_TRANSCRIPT_DEFAULTS, "channel": channel, "guild_override": guild, **kwargs})
+
+
+def _quoted_attachment_url(message: discord.Message) -> str:
+    return quote(message.attachments[0].url, safe="")
+
+
+def _temporary_file():
+    fp = tempfile.TemporaryFile()
+    if isinstance(fp, io.IOBase):
+        return fp
+
+    # Outside POSIX this is a wrapper object, which discord.File would not accept as a file. Duplicate its
+    # descriptor into a plain file object; the file is still removed once the last descriptor is closed.
+    with fp:
+        return open(os.dup(fp.fileno()), "w+b")
+
+
+async def _spool_transcript(transcript: Transcript):
+    # SpooledTemporaryFile is only an io.IOBase from Python 3.11, so spill a BytesIO to disk by hand
+    buffer = io.BytesIO()
+    try:
+        async for chunk in transcript.export_stream():
+            buffer.write(chunk)
+            if isinstance(buffer, io.BytesIO) and buffer.tell() > _SPOOL_THRESHOLD:
+                in_memory, buffer = buffer, _temporary_file()
+                with in_memory, in_memory.getbuffer() as view:
+                    buffer.write(view)
+    except BaseException:
+        buffer.close()
+        raise
+
+    buffer.seek(0)
+    return buffer
+
+
 async def quick_export(
-    channel: discord.TextChannel,
-    guild: Optional[discord.Guild] = None,
+    channel: Union[discord.TextChannel, str],
+    guild: Optional[Union[discord.Guild, str]] = None,
     bot: Optional[discord.Client] = None,
+    ticket_id: Optional[str] = None,
+    client: Optional[discord.Client] = None,
 ):
     """
     Create a quick export of your Discord channel.
     This function will produce the transcript and post it back in to your channel.
-    :param channel: discord.TextChannel
-    :param guild: (optional) discord.Guild
+    When given the channel and guild as ID strings, the transcript is instead written to the ticket transcript folder.
+    :param channel: discord.TextChannel or string - channel ID when exporting to file
+    :param guild: (optional) discord.Guild or string - guild ID when exporting to file
     :param bot: (optional) discord.Client
+    :param ticket_id: (optional) string - ticket ID used in the file name when exporting to file
+    :param client: (optional) discord.Client - used to resolve the IDs when exporting to file
     :return: discord.Message (posted transcript)
     """
+    if isinstance(channel, str):
+        return await _quick_export_to_file(channel, guild, ticket_id, client)
+
+    transcript = _build_transcript(channel, guild, bot=bot)
+    buffer = await _spool_transcript(transcript)
 
-    if guild:
-        channel.guild = guild
-
-    transcript = (
-        await Transcript(
-            channel=channel,
-            limit=None,
-            messages=None,
-            pytz_timezone="UTC",
-            military_time=True,
-            fancy_times=True,
-            before=None,
-            after=None,
-            support_dev=True,
-            bot=bot,
-            attachment_handler=None
-            ).export()
-        ).html
-
-    if not transcript:
+    if not transcript.message_count:
+        buffer.close()
         return
 
-    transcript_embed = discord.Embed(
+    transcript_embed = _Embed(
         description=f"**Transcript Name:** transcript-{channel.name}\n\n",
-        colour=discord.Colour.blurple()
+        colour=_BLURPLE
     )
 
-    transcript_file = discord.File(io.BytesIO(transcript.encode()), filename=f"transcript-{channel.name}.html")
+    transcript_file = _File(buffer, filename=f"transcript-{channel.name}.html")
     return await channel.send(embed=transcript_embed, file=transcript_file)
 
 
+async def _quick_export_to_file(
+    channel: str,
+    guild: str,
+    ticket_id: Optional[str],
+    client: discord.Client,
+):
+    guild = client.get_guild(int(guild))
+    channel = guild.get_channel(int(channel))
+
+    try:
+        transcript = _build_transcript(channel, guild, limit=10000)
+        buffer = await _spool_transcript(transcript)
+    except discord.HTTPException:
+        _log.exception(
+            "Transcript generation failed for channel %s. Please send a screenshot of this error to "
+            "https://www.github.com/mahtoid/DiscordChatExporterPy", channel.id
+        )
+        await channel.send(embed=_ERROR_EMBED)
+        return
+
+    if not transcript.message_count:
+        buffer.close()
+        return
+
+    _ensure_transcript_dir()
+    ticket_name = f"transcript-{channel.name}---{ticket_id}---.html"
+    with buffer, open(os.path.join(_TRANSCRIPT_DIR, ticket_name), "wb") as f:
+        shutil.copyfileobj(buffer, f)
+
+    needle = f"transcript-{channel.name}.html"
+
+    def is_old_transcript(m: discord.Message) -> bool:
+        return m.author == client.user and any(needle in (a.filename or "") for a in m.attachments)
+
+    # Bulk deletion needs Manage Messages even for the bot's own messages, so fall back to deleting one by one
+    try:
+        try:
+            await channel.purge(limit=_CLEANUP_LIMIT, check=is_old_transcript)
+        except discord.Forbidden:
+            await channel.purge(limit=_CLEANUP_LIMIT, check=is_old_transcript, bulk=False)
+    except discord.HTTPException:
+        _log.exception("Could not remove old transcripts from channel %s", channel.id)
+
+
 async def export(
     channel: discord.TextChannel,
     limit: Optional[int] = None,
@@ -79,26 +204,26 @@ async def export(
     :param before: (optional) datetime.datetime - allows before time for history
     :param after: (optional) datetime.datetime - allows after time for history
     :param attachment_handler: (optional) attachment_handler.AttachmentHandler - allows custom asset handling
-    :return: string - transcript file make up
+    :return: string - transcript file make up (None if there are no messages)
     """
-    if guild:
-        channel.guild = guild
-
-    return (
-        await Transcript(
-            channel=channel,
-            limit=limit,
-            messages=None,
-            pytz_timezone=tz_info,
-            military_time=military_time,
-            fancy_times=fancy_times,
-            before=before,
-            after=after,
-            support_dev=support_dev,
-            bot=bot,
-            attachment_handler=attachment_handler,
-        ).export()
-    ).html
+    transcript = await _build_transcript(
+        channel,
+        guild,
+        limit=limit,
+        pytz_timezone=tz_info,
+        military_time=military_time,
+        fancy_times=fancy_times,
+        before=before,
+        after=after,
+        support_dev=support_dev,
+        bot=bot,
+        attachment_handler=attachment_handler,
+    ).export()
+
+    if not transcript.message_count:
+        return None
+
+    return transcript.html
 
 
 async def raw_export(
@@ -123,26 +248,24 @@ async def raw_export(
     :param military_time: (optional) boolean - set military time (24hour clock)
     :param fancy_times: (optional) boolean - set javascript around time display
     :param attachment_handler: (optional) AttachmentHandler - allows custom asset handling
-    :return: string - transcript file make up
+    :return: string - transcript file make up (None if there are no messages)
     """
-    if guild:
-        channel.guild = guild
-
-    return (
-        await Transcript(
-            channel=channel,
-            limit=None,
-            messages=messages,
-            pytz_timezone=tz_info,
-            military_time=military_time,
-            fancy_times=fancy_times,
-            before=None,
-            after=None,
-            support_dev=support_dev,
-            bot=bot,
-            attachment_handler=attachment_handler
-        ).export()
-    ).html
+    transcript = await _build_transcript(
+        channel,
+        guild,
+        messages=messages,
+        pytz_timezone=tz_info,
+        military_time=military_time,
+        fancy_times=fancy_times,
+        support_dev=support_dev,
+        bot=bot,
+        attachment_handler=attachment_handler,
+    ).export()
+
+    if not transcript.message_count:
+        return None
+
+    return transcript.html
 
 
 async def quick_link(
@@ -156,87 +279,12 @@ async def quick_link(
     :param message: discord.Message
     :return: discord.Message (posted link)
     """
-    embed = discord.Embed(
-        title="Transcript Link",
-        description=(
-            f"[Click here to view the transcript](https://mahto.id/chat-exporter?url={message.attachments[0].url})"
-        ),
-        colour=discord.Colour.blurple(),
-    )
+    embed = _LINK_EMBED_TEMPLATE.copy()
+    embed.description = _LINK_DESC_FMT.format(_quoted_attachment_url(message))
 
     return await channel.send(embed=embed)
 
 
-async def quick_export(
-    channel: str,
-    guild: str = None,
-    ticket_id: str = None,
-    client: discord.Client = None,
-):
-    guild = client.get_guild(int(guild))
-    channel = guild.get_channel(int(channel))
-
-    # noinspection PyBroadException
-    try:
-        transcript = await Transcript.export(channel, None, "Europe/London")
-    except Exception:
-        traceback.print_exc()
-        error_embed = discord.Embed(
-            title="Transcript Generation Failed!",
-            description="Whoops! We've stumbled in to an issue here.",
-            colour=discord.Colour.red()
-        )
-        await channel.send(embed=error_embed)
-        print(f"Please send a screenshot of the above error to https://www.github.com/mahtoid/DiscordChatExporterPy")
-        return
-
-    async for m in channel.history(limit=None):
-        try:
-            for f in m.attachments:
-                if f"transcript-{channel.name}.html" in f.filename:
-                    await m.delete()
-        except TypeError:
-            continue
-
-    ticket_name = f"transcript-{channel.name}---{ticket_id}---.html"
-    with open(f"/var/www/html/transcripts/{ticket_name}", "w") as f:
-        f.write(transcript.html)
-
-async def quick_export(
-    channel: str,
-    guild: str = None,
-    ticket_id: str = None,
-    client: discord.Client = None,
-):
-    guild = client.get_guild(int(guild))
-    channel = guild.get_channel(int(channel))
-
-    # noinspection PyBroadException
-    try:
-        transcript = await export(channel=channel, limit=10000, guild=guild)
-    except Exception:
-        traceback.print_exc()
-        error_embed = discord.Embed(
-            title="Transcript Generation Failed!",
-            description="Whoops! We've stumbled in to an issue here.",
-            colour=discord.Colour.red()
-        )
-        await channel.send(embed=error_embed)
-        print(f"Please send a screenshot of the above error to https://www.github.com/mahtoid/DiscordChatExporterPy")
-        return
-
-    async for m in channel.history(limit=None):
-        try:
-            for f in m.attachments:
-                if f"transcript-{channel.name}.html" in f.filename:
-                    await m.delete()
-        except TypeError:
-            continue
-
-    ticket_name = f"transcript-{channel.name}---{ticket_id}---.html"
-    with open(f"/var/www/html/transcripts/{ticket_name}", "w") as f:
-        f.write(transcript)
-
 async def link(
     message: discord.Message
 ):
@@ -246,4 +294,4 @@ async def link(
     :param message: discord.Message
     :return: string (link: https://mahto.id/chat-exporter?url=ATTACHMENT_URL)
     """
-    return "https://mahto.id/chat-exporter?url=" + message.attachments[0].url
+    return _VIEWER_URL_FMT.format(_quoted_attachment_url(message))
@@ -12,6 +12,8 @@ from chat_exporter.ext.html_generator import (
 
 
 class Attachment:
+    __slots__ = ("attachments", "guild")
+
     def __init__(self, attachments, guild):
         self.attachments = attachments
         self.guild = guild
@@ -14,6 +14,8 @@ from chat_exporter.ext.html_generator import (
 
 
 class Component:
+    __slots__ = ("component", "guild", "components", "menus", "buttons")
+
     styles = {
         "primary": "#5865F2",
         "secondary": "#4F545C",
@@ -27,14 +29,14 @@ class Component:
         "link": "#4F545C",
     }
 
-    components: str = ""
-    menus: str = ""
-    buttons: str = ""
     menu_div_id: int = 0
 
     def __init__(self, component, guild):
         self.component = component
         self.guild = guild
+        self.components = ""
+        self.menus = []
+        self.buttons = []
 
     async def build_component(self, c):
         if isinstance(c, discord.Button):
@@ -57,7 +59,7 @@ class Component:
         style = self.styles[str(c.style).split(".")[1]]
         emoji = str(c.emoji) if c.emoji else ""
 
-        self.buttons += await fill_out(self.guild, component_button, [
+        self.buttons.append(await fill_out(self.guild, component_button, [
             ("DISABLED", "chatlog__component-disabled" if c.disabled else "", PARSE_MODE_NONE),
             ("URL", url, PARSE_MODE_NONE),
             ("LABEL", label, PARSE_MODE_MARKDOWN),
@@ -65,7 +67,7 @@ class Component:
             ("ICON", icon, PARSE_MODE_NONE),
             ("TARGET", target, PARSE_MODE_NONE),
             ("STYLE", style, PARSE_MODE_NONE)
-        ])
+        ]))
 
     async def build_menu(self, c):
         placeholder = c.placeholder if c.placeholder else ""
@@ -75,13 +77,13 @@ class Component:
         if not c.disabled:
             content = await self.build_menu_options(options)
 
-        self.menus += await fill_out(self.guild, component_menu, [
+        self.menus.append(await fill_out(self.guild, component_menu, [
             ("DISABLED", "chatlog__component-disabled" if c.disabled else "", PARSE_MODE_NONE),
             ("ID", str(self.menu_div_id), PARSE_MODE_NONE),
             ("PLACEHOLDER", str(placeholder), PARSE_MODE_MARKDOWN),
             ("CONTENT", str(content), PARSE_MODE_NONE),
             ("ICON", DiscordUtils.interaction_dropdown_icon, PARSE_MODE_NONE),
-        ])
+        ]))
 
     async def build_menu_options(self, options):
         content = []
@@ -108,9 +110,9 @@ class Component:
             await self.build_component(c)
 
         if self.menus:
-            self.components += f'<div class="chatlog__components">{self.menus}</div>'
+            self.components += f'<div class="chatlog__components">{"".join(self.menus)}</div>'
 
         if self.buttons:
-            self.components += f'<div class="chatlog__components">{self.buttons}</div>'
+            self.components += f'<div class="chatlog__components">{"".join(self.buttons)}</div>'
 
         return self.components
@@ -31,6 +31,11 @@ def _gather_checker():
 
 
 class Embed:
+    __slots__ = (
+        "embed", "guild", "check_against", "r", "g", "b", "title", "description", "author", "image", "thumbnail",
+        "footer", "fields",
+    )
+
     r: str
     g: str
     b: str
@@ -42,11 +47,10 @@ class Embed:
     footer: str
     fields: str
 
-    check_against = None
-
     def __init__(self, embed, guild):
         self.embed: discord.Embed = embed
         self.guild: discord.Guild = guild
+        self.check_against = None
 
     async def flow(self):
         self.check_against = _gather_checker()
@@ -91,19 +95,22 @@ class Embed:
         if not self.embed.fields:
             return
 
+        fields = []
         for field in self.embed.fields:
             field.name = html.escape(field.name)
             field.value = html.escape(field.value)
 
             if field.inline:
-                self.fields += await fill_out(self.guild, embed_field_inline, [
+                fields.append(await fill_out(self.guild, embed_field_inline, [
                     ("FIELD_NAME", field.name, PARSE_MODE_SPECIAL_EMBED),
                     ("FIELD_VALUE", field.value, PARSE_MODE_EMBED)
-                ])
+                ]))
             else:
-                self.fields += await fill_out(self.guild, embed_field, [
+                fields.append(await fill_out(self.guild, embed_field, [
                     ("FIELD_NAME", field.name, PARSE_MODE_SPECIAL_EMBED),
-                    ("FIELD_VALUE", field.value, PARSE_MODE_EMBED)])
+                    ("FIELD_VALUE", field.value, PARSE_MODE_EMBED)]))
+
+        self.fields = "".join(fields)
 
     async def build_author(self):
         self.author = html.escape(self.embed.author.name) if (
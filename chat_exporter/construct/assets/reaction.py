@@ -5,6 +5,8 @@ from chat_exporter.ext.html_generator import fill_out, emoji, custom_emoji, PARS
 
 
 class Reaction:
+    __slots__ = ("reaction", "guild")
+
     def __init__(self, reaction, guild):
         self.reaction = reaction
         self.guild = guild
@@ -1,3 +1,4 @@
+import asyncio
 import html
 import io
 import traceback
@@ -5,7 +6,7 @@ from typing import List, Optional, Union
 
 import aiohttp
 from pytz import timezone
-from datetime import timedelta
+from datetime import timedelta, tzinfo
 
 from chat_exporter.construct.attachment_handler import AttachmentHandler
 from chat_exporter.ext.discord_import import discord
@@ -35,6 +36,8 @@ from chat_exporter.ext.html_generator import (
     message_thread_add,
 )
 
+_UTC = timezone("UTC")
+
 
 def _gather_user_bot(author: discord.Member):
     if author.bot and author.public_flags.verified_bot:
@@ -49,22 +52,17 @@ def _set_edit_at(message_edited_at):
 
 
 class MessageConstruct:
-    message_html: str = ""
-
-    # Asset Types
-    embeds: str = ""
-    reactions: str = ""
-    components: str = ""
-    attachments: str = ""
-    time_format: str = ""
-
-    interaction: str = ""
+    __slots__ = (
+        "message", "previous_message", "timezone", "military_time", "guild", "message_dict",
+        "attachment_handler", "time_format", "message_created_at", "message_edited_at", "meta_data", "audit",
+        "message_html", "embeds", "reactions", "components", "attachments", "interaction",
+    )
 
     def __init__(
         self,
         message: discord.Message,
         previous_message: Optional[discord.Message],
-        pytz_timezone,
+        tz_info: tzinfo,
         military_time: bool,
         guild: discord.Guild,
         meta_data: dict,
@@ -73,11 +71,21 @@ class MessageConstruct:
     ):
         self.message = message
         self.previous_message = previous_message
-        self.pytz_timezone = pytz_timezone
+        self.timezone = tz_info
         self.military_time = military_time
         self.guild = guild
         self.message_dict = message_dict
         self.attachment_handler = attachment_handler
+        self.message_html = ""
+
+        # Asset Types
+        self.embeds = ""
+        self.reactions = ""
+        self.components = ""
+        self.attachments = ""
+
+        self.interaction = ""
+
         self.time_format = "%A, %e %B %Y %I:%M %p"
         if self.military_time:
             self.time_format = "%A, %e %B %Y %H:%M"
@@ -267,19 +275,27 @@ class MessageConstruct:
         ])
 
     async def build_assets(self):
+        embeds = []
         for e in self.message.embeds:
-            self.embeds += await Embed(e, self.guild).flow()
+            embeds.append(await Embed(e, self.guild).flow())
+        self.embeds = "".join(embeds)
 
+        attachments = []
         for a in self.message.attachments:
             if self.attachment_handler and isinstance(self.attachment_handler, AttachmentHandler):
                 a = await self.attachment_handler.process_asset(a)
-            self.attachments += await Attachment(a, self.guild).flow()
+            attachments.append(await Attachment(a, self.guild).flow())
+        self.attachments = "".join(attachments)
 
+        components = []
         for c in self.message.components:
-            self.components += await Component(c, self.guild).flow()
+            components.append(await Component(c, self.guild).flow())
+        self.components = "".join(components)
 
+        reactions = []
         for r in self.message.reactions:
-            self.reactions += await Reaction(r, self.guild).flow()
+            reactions.append(await Reaction(r, self.guild).flow())
+        self.reactions = "".join(reactions)
 
         if self.reactions:
             self.reactions = f'<div class="chatlog__reactions">{self.reactions}</div>'
@@ -329,12 +345,12 @@ class MessageConstruct:
 
             time = self.message.created_at
             if not self.message.created_at.tzinfo:
-                time = timezone("UTC").localize(time)
+                time = _UTC.localize(time)
 
             if self.military_time:
-                default_timestamp = time.astimezone(timezone(self.pytz_timezone)).strftime("%d-%m-%Y %H:%M")
+                default_timestamp = time.astimezone(self.timezone).strftime("%d-%m-%Y %H:%M")
             else:
-                default_timestamp = time.astimezone(timezone(self.pytz_timezone)).strftime("%d-%m-%Y %I:%M %p")
+                default_timestamp = time.astimezone(self.timezone).strftime("%d-%m-%Y %I:%M %p")
 
             self.message_html += await fill_out(self.guild, start_message, [
                 ("REFERENCE_SYMBOL", followup_symbol, PARSE_MODE_NONE),
@@ -450,9 +466,9 @@ class MessageConstruct:
 
     def to_local_time_str(self, time):
         if not self.message.created_at.tzinfo:
-            time = timezone("UTC").localize(time)
+            time = _UTC.localize(time)
 
-        local_time = time.astimezone(timezone(self.pytz_timezone))
+        local_time = time.astimezone(self.timezone)
 
         return local_time.strftime(self.time_format)
 
@@ -460,11 +476,11 @@ class MessageConstruct:
 async def gather_messages(
     messages: List[discord.Message],
     guild: discord.Guild,
-    pytz_timezone,
+    tz_info: tzinfo,
     military_time,
     attachment_handler: Optional[AttachmentHandler],
 ) -> (str, dict):
-    message_html: str = ""
+    message_html: List[str] = []
     meta_data: dict = {}
     previous_message: Optional[discord.Message] = None
 
@@ -484,7 +500,7 @@ async def gather_messages(
         content_html, meta_data = await MessageConstruct(
             message,
             previous_message,
-            pytz_timezone,
+            tz_info,
             military_time,
             guild,
             meta_data,
@@ -492,8 +508,11 @@ async def gather_messages(
             attachment_handler,
             ).construct_message()
 
-        message_html += content_html
+        message_html.append(content_html)
         previous_message = message
 
-    message_html += "</div>"
-    return message_html, meta_data
+        # Messages built purely from cached data never suspend, so yield to the event loop between them
+        await asyncio.sleep(0)
+
+    message_html.append("</div>")
+    return "".join(message_html), meta_data
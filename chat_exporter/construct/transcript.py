@@ -1,6 +1,7 @@
+import asyncio
 import datetime
 import html
-import traceback
+import logging
 
 import re
 from typing import List, Optional
@@ -20,9 +21,17 @@ from chat_exporter.ext.html_generator import (
     fill_out, total, channel_topic, meta_data_temp, fancy_time, channel_subject, PARSE_MODE_NONE
 )
 
+_log = logging.getLogger(__name__)
+
 
 class TranscriptDAO:
+    __slots__ = (
+        "channel", "guild", "messages", "limit", "military_time", "fancy_times", "before", "after", "support_dev",
+        "pytz_timezone", "timezone", "attachment_handler", "html", "message_count",
+    )
+
     html: str
+    message_count: int
 
     def __init__(
         self,
@@ -37,8 +46,10 @@ class TranscriptDAO:
         support_dev: bool,
         bot: Optional[discord.Client],
         attachment_handler: Optional[AttachmentHandler],
+        guild_override: Optional[discord.Guild] = None,
     ):
         self.channel = channel
+        self.guild = guild_override or channel.guild
         self.messages = messages
         self.limit = int(limit) if limit else None
         self.military_time = military_time
@@ -47,6 +58,7 @@ class TranscriptDAO:
         self.after = after
         self.support_dev = support_dev
         self.pytz_timezone = pytz_timezone
+        self.timezone = pytz.timezone(pytz_timezone)
         self.attachment_handler = attachment_handler
 
         # This is to pass timezone in to mention.py without rewriting
@@ -58,8 +70,8 @@ class TranscriptDAO:
     async def build_transcript(self):
         message_html, meta_data = await gather_messages(
             self.messages,
-            self.channel.guild,
-            self.pytz_timezone,
+            self.guild,
+            self.timezone,
             self.military_time,
             self.attachment_handler
         )
@@ -69,19 +81,19 @@ class TranscriptDAO:
         return self
 
     async def export_transcript(self, message_html: str, meta_data: str):
-        guild_icon = self.channel.guild.icon if (
-                self.channel.guild.icon and len(self.channel.guild.icon) > 2
+        guild_icon = self.guild.icon if (
+                self.guild.icon and len(self.guild.icon) > 2
         ) else DiscordUtils.default_avatar
 
-        guild_name = html.escape(self.channel.guild.name)
+        guild_name = html.escape(self.guild.name)
 
-        timezone = pytz.timezone(self.pytz_timezone)
+        timezone = self.timezone
         if self.military_time:
             time_now = datetime.datetime.now(timezone).strftime("%e %B %Y at %H:%M:%S (%Z)")
         else:
             time_now = datetime.datetime.now(timezone).strftime("%e %B %Y at %I:%M:%S %p (%Z)")
 
-        meta_data_html: str = ""
+        meta_data_html: List[str] = []
         for data in meta_data:
             creation_time = meta_data[int(data)][1].astimezone(timezone).strftime("%b %d, %Y")
             joined_time = (
@@ -93,7 +105,7 @@ class TranscriptDAO:
             discrim = str(meta_data[int(data)][0][-5:])
             user = str(meta_data[int(data)][0])
 
-            meta_data_html += await fill_out(self.channel.guild, meta_data_temp, [
+            meta_data_html.append(await fill_out(self.guild, meta_data_temp, [
                 ("USER_ID", str(data), PARSE_MODE_NONE),
                 ("USERNAME", user[:-5] if re.match(pattern, discrim) else user, PARSE_MODE_NONE),
                 ("DISCRIMINATOR", discrim if re.match(pattern, discrim) else ""),
@@ -106,7 +118,7 @@ class TranscriptDAO:
                 ("USER_AVATAR", str(meta_data[int(data)][3]), PARSE_MODE_NONE),
                 ("DISPLAY", str(meta_data[int(data)][6]), PARSE_MODE_NONE),
                 ("MESSAGE_COUNT", str(meta_data[int(data)][4]))
-            ])
+            ]))
 
         if self.military_time:
             channel_creation_time = self.channel.created_at.astimezone(timezone).strftime("%b %d, %Y (%H:%M:%S)")
@@ -119,7 +131,7 @@ class TranscriptDAO:
 
         channel_topic_html = ""
         if raw_channel_topic:
-            channel_topic_html = await fill_out(self.channel.guild, channel_topic, [
+            channel_topic_html = await fill_out(self.guild, channel_topic, [
                 ("CHANNEL_TOPIC", html.escape(raw_channel_topic))
             ])
 
@@ -127,7 +139,7 @@ class TranscriptDAO:
         if self.limit:
             limit = f"latest {self.limit} messages"
 
-        subject = await fill_out(self.channel.guild, channel_subject, [
+        subject = await fill_out(self.guild, channel_subject, [
             ("LIMIT", limit, PARSE_MODE_NONE),
             ("CHANNEL_NAME", self.channel.name),
             ("RAW_CHANNEL_TOPIC", str(raw_channel_topic))
@@ -147,19 +159,19 @@ class TranscriptDAO:
             else:
                 time_format = "hh:mm A"
 
-            _fancy_time = await fill_out(self.channel.guild, fancy_time, [
+            _fancy_time = await fill_out(self.guild, fancy_time, [
                 ("TIME_FORMAT", time_format, PARSE_MODE_NONE),
                 ("TIMEZONE", str(self.pytz_timezone), PARSE_MODE_NONE)
             ])
 
-        self.html = await fill_out(self.channel.guild, total, [
+        self.html = await fill_out(self.guild, total, [
             ("SERVER_NAME", f"{guild_name}"),
-            ("GUILD_ID", str(self.channel.guild.id), PARSE_MODE_NONE),
+            ("GUILD_ID", str(self.guild.id), PARSE_MODE_NONE),
             ("SERVER_AVATAR_URL", str(guild_icon), PARSE_MODE_NONE),
             ("CHANNEL_NAME", f"{self.channel.name}"),
-            ("MESSAGE_COUNT", str(len(self.messages))),
+            ("MESSAGE_COUNT", str(self.message_count)),
             ("MESSAGES", message_html, PARSE_MODE_NONE),
-            ("META_DATA", meta_data_html, PARSE_MODE_NONE),
+            ("META_DATA", "".join(meta_data_html), PARSE_MODE_NONE),
             ("DATE_TIME", str(time_now)),
             ("SUBJECT", subject, PARSE_MODE_NONE),
             ("CHANNEL_CREATED_AT", str(channel_creation_time), PARSE_MODE_NONE),
@@ -172,6 +184,8 @@ class TranscriptDAO:
 
 
 class Transcript(TranscriptDAO):
+    __slots__ = ()
+
     async def export(self):
         if not self.messages:
             self.messages = [message async for message in self.channel.history(
@@ -183,10 +197,27 @@ class Transcript(TranscriptDAO):
         if not self.after:
             self.messages.reverse()
 
+        self.message_count = len(self.messages)
+        if not self.message_count:
+            self.html = ""
+            return self
+
         try:
             return await super().build_transcript()
         except Exception:
             self.html = "Whoops! Something went wrong..."
-            traceback.print_exc()
-            print("Please send a screenshot of the above error to https://www.github.com/mahtoid/DiscordChatExporterPy")
+            _log.exception(
+                "Transcript generation failed for channel %s. Please send a screenshot of this error to "
+                "https://www.github.com/mahtoid/DiscordChatExporterPy", self.channel.id
+            )
             return self
+
+    async def export_stream(self, chunk_size: int = 1 << 20):
+        await self.export()
+
+        # Encode piecewise so no full encoded copy is built here, and release the HTML once it has been streamed
+        for i in range(0, len(self.html), chunk_size):
+            yield self.html[i:i + chunk_size].encode("utf-8")
+            await asyncio.sleep(0)
+
+        self.html = ""